@@ -1,17 +1,158 @@
 from AgentLayer.ConventionalAgents.ConventionalAgent import ConventionalAgent
+from AgentLayer.ConventionalAgents.HuberRegressorFast import HuberRegressorFast
 import numpy as np
+import scipy.linalg
+import scipy.linalg.blas
+import scipy.optimize
 from sklearn.linear_model import HuberRegressor
 import pandas as pd
 import pickle
-from pypfopt import EfficientFrontier
-from pypfopt import risk_models
-from pypfopt import objective_functions
+from joblib import Parallel, delayed
 from utils import read_config_file
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 
 config = read_config_file()
 
 
+def _clip_normalize(z):
+    """Projects a raw tangency solution onto the long-only simplex by
+    clipping to [0, 1] and renormalizing.
+
+    Args:
+        z (np.ndarray): raw solution of the tangency linear system
+
+    Returns:
+        np.ndarray: long-only weights summing to one
+    """
+    w = np.clip(z, 0, 1)
+    if w.sum() <= 0:
+        return np.full(len(z), 1 / len(z))
+    return w / w.sum()
+
+
+def _solve_tangency(factor, mu, w_prev=None, k=0.0):
+    """Solves one date's tangency portfolio from a precomputed Cholesky
+    factor.
+
+    The unconstrained maximum-Sharpe portfolio is proportional to
+    sigma^-1 mu, obtained here with a single Cholesky solve. When the
+    previous weights are given, the linear transaction cost term is
+    handled with one correction solve on the adjusted returns.
+
+    Args:
+        factor (tuple): Cholesky factorization as accepted by cho_solve
+        mu (np.ndarray): predicted y values (expected returns)
+        w_prev (np.ndarray, optional): weights of the previous date
+        k (float) : transaction cost
+
+    Returns:
+        np.ndarray: optimized weights
+    """
+    w = _clip_normalize(scipy.linalg.cho_solve(factor, mu))
+    if w_prev is None or k == 0.0:
+        return w
+    # one correction pass for the linear transaction cost term
+    mu_adjusted = mu - k * np.sign(w - np.asarray(w_prev, dtype=np.float64))
+    return _clip_normalize(scipy.linalg.cho_solve(factor, mu_adjusted))
+
+
+def _neg_sharpe(w, mu, sigma, w_prev, k):
+    """Negative Sharpe ratio objective with a linear transaction cost term.
+
+    Args:
+        w (np.ndarray): candidate weights
+        mu (np.ndarray): expected returns
+        sigma (np.ndarray): covarience matrix
+        w_prev (np.ndarray): weights of the previous date
+        k (float) : transaction cost
+
+    Returns:
+        float: objective value
+    """
+    ret = mu @ w
+    vol = np.sqrt(w @ sigma @ w)
+    return -ret / vol + k * np.abs(w - w_prev).sum()
+
+
+def _neg_sharpe_grad(w, mu, sigma, w_prev, k):
+    """Analytic gradient of _neg_sharpe.
+
+    Args:
+        w (np.ndarray): candidate weights
+        mu (np.ndarray): expected returns
+        sigma (np.ndarray): covarience matrix
+        w_prev (np.ndarray): weights of the previous date
+        k (float) : transaction cost
+
+    Returns:
+        np.ndarray: gradient vector
+    """
+    ret = mu @ w
+    vol = np.sqrt(w @ sigma @ w)
+    return -mu / vol + (ret / vol ** 3) * (sigma @ w) \
+        + k * np.sign(w - w_prev)
+
+
+@njit(cache=True, fastmath=True)
+def _portfolio_step(weights, cap, close_curr, close_next):
+    """Advances the account value by one trade date.
+
+    Fuses the cash allocation, share count and next-day valuation into a
+    single pass over the assets, so no intermediate arrays are allocated.
+
+    Args:
+        weights (np.ndarray): optimized weights for the current date
+        cap (float): account value at the current date
+        close_curr (np.ndarray): close prices at the current date
+        close_next (np.ndarray): close prices at the next date
+
+    Returns:
+        float: account value at the next date
+    """
+    total = 0.0
+    for j in range(weights.shape[0]):
+        total += (weights[j] * cap / close_curr[j]) * close_next[j]
+    return total
+
+
+def _chol_update(L, x, sign=1.0):
+    """Applies an in-place rank-1 update (sign=1) or downdate (sign=-1)
+    to a lower-triangular Cholesky factor, so that the factored matrix
+    becomes L L^T + sign * x x^T. Runs in O(n^2).
+
+    Args:
+        L (np.ndarray): lower-triangular Cholesky factor, modified in place
+        x (np.ndarray): rank-1 update vector
+        sign (float) : 1.0 for an update, -1.0 for a downdate
+
+    Raises:
+        np.linalg.LinAlgError: if a downdate would leave the matrix
+        non positive-definite.
+    """
+    x = np.array(x, dtype=np.float64)
+    n = len(x)
+    for k in range(n):
+        r2 = L[k, k] ** 2 + sign * x[k] ** 2
+        if r2 <= 0:
+            raise np.linalg.LinAlgError(
+                "Cholesky downdate left the matrix non positive-definite")
+        r = np.sqrt(r2)
+        c = r / L[k, k]
+        s = x[k] / L[k, k]
+        L[k, k] = r
+        if k + 1 < n:
+            L[k + 1:, k] = (L[k + 1:, k] + sign * s * x[k + 1:]) / c
+            x[k + 1:] = c * x[k + 1:] - s * L[k + 1:, k]
+
+
 class HRAgent(ConventionalAgent):
     """Provides methods Huber Regressor Agent.
 
@@ -38,8 +179,11 @@ class HRAgent(ConventionalAgent):
             predicts the expected return.
             helper function for the main predict method.
         _weight_optimization()
-            optimizes weights using efficient frontier.
-            helper function for the main predict method.
+            optimizes weights with the iterative SLSQP optimizer.
+            helper function for the exact=False path of predict.
+        _update_cov_cache()
+            maintains the covariance matrix and its Cholesky factor.
+            helper function for _return_predict.
     """
 
     def __init__(self, *,
@@ -48,25 +192,37 @@ class HRAgent(ConventionalAgent):
                  alpha=0.0001,
                  warm_start=False,
                  fit_intercept=True,
-                 tol=1e-05):
+                 tol=1e-05,
+                 backend="sklearn"):
         """Initialize Huber Regressor Agent object
 
         Args:
             epsilon (float, optional): The parameter epsilon controls the number of samples that should be classified as outliers.. Defaults to 1.35.
             max_iter (int, optional): Maximum number of iterations . Defaults to 1000.
             alpha (float, optional): Regularization parameter.. Defaults to 0.0001.
-            warm_start (bool, optional): This is useful if the stored attributes of a previously used model has to be reused. 
+            warm_start (bool, optional): This is useful if the stored attributes of a previously used model has to be reused.
             If set to False, then the coefficients will be rewritten for every call to fit. Defaults to False.
             fit_intercept (bool, optional): Whether or not to fit the intercept. Defaults to True.
             tol (float, optional): The iteration will stop when max{|proj g_i | i = 1, ..., n} <= tol where pg_i is the i-th component of the projected gradient. Defaults to 1e-05.
+            backend (str, optional): "sklearn" for HuberRegressor or "skglm"
+            for the Numba-jitted HuberRegressorFast. Defaults to "sklearn".
         """
 
-        self.model = HuberRegressor(epsilon=epsilon,
-                                    max_iter=max_iter,
-                                    alpha=alpha,
-                                    warm_start=warm_start,
-                                    fit_intercept=fit_intercept,
-                                    tol=tol)
+        if backend == "skglm":
+            self.model = HuberRegressorFast(epsilon=epsilon,
+                                            max_iter=max_iter,
+                                            alpha=alpha,
+                                            fit_intercept=fit_intercept,
+                                            tol=tol)
+        else:
+            self.model = HuberRegressor(epsilon=epsilon,
+                                        max_iter=max_iter,
+                                        alpha=alpha,
+                                        warm_start=warm_start,
+                                        fit_intercept=fit_intercept,
+                                        tol=tol)
+        # cached covariance state reused across consecutive trade dates
+        self._cov_state = {"L": None, "window": None}
 
     def get_params(self, deep=True):
         """Get parameters for this estimator.
@@ -98,7 +254,9 @@ class HRAgent(ConventionalAgent):
                 test_data,
                 initial_capital=1000000,
                 transaction_cost_pct=0.001,
-                feature_list=config["TEST_PARAMS"]["HR_PARAMS"]["feature_list"]
+                feature_list=config["TEST_PARAMS"]["HR_PARAMS"]["feature_list"],
+                exact=True,
+                n_jobs=-1
                 ):
         """Main prediction method.
 
@@ -107,141 +265,241 @@ class HRAgent(ConventionalAgent):
             initial_capital (int) : initial capital
             feature_list (list) : a list of features to be used for prediction
             transaction_cost_pct (float) : transaction cost
+            exact (bool) : if True, computes the closed-form tangency portfolio
+            instead of running the iterative optimizer at every date.
+            n_jobs (int) : number of joblib workers used to solve the
+            per-date tangency portfolios when exact is True. Defaults to -1
+            (all cores).
 
         Returns:
             pd.DataFrame: portfolio with dates and account value
             pd.DataFrame: dataframe that holds info for each ticker for each day the weight
             and predicted y value.
+
         """
 
-        meta_coefficient = {"date": []}
-        for i in test_data.tic:
-            meta_coefficient[i] = []
+        # stable sort so each date's rows are contiguous; cheap when the
+        # data already comes date-sorted from get_split_data
+        test_data = test_data.sort_values(
+            ["date", "tic"], kind="mergesort", ignore_index=True)
+        unique_tics = test_data.tic.unique()
+        tic_to_idx = {tic: j for j, tic in enumerate(unique_tics)}
         unique_trade_date = test_data.date.unique()
-        weight_arr = [
-            np.array([1/len(test_data.tic.unique())]*len(test_data.tic.unique()))]
-        portfolio = pd.DataFrame(index=range(1), columns=unique_trade_date)
-        portfolio.loc[0, unique_trade_date[0]] = initial_capital
-        for i in range(len(unique_trade_date) - 1):
-            mu, sigma, tics, df_current, df_next = self._return_predict(
-                unique_trade_date, test_data, i, tech_indicator_list)
-
-            portfolio_value, weight_arr = self._weight_optimization(
-                i, unique_trade_date, meta_coefficient, mu, sigma, tics, portfolio, df_current, df_next, transaction_cost_pct, weight_arr)
-
-        portfolio = portfolio_value
-        portfolio = portfolio.T
-        portfolio.columns = ['account_value']
-        portfolio = portfolio.reset_index()
-        portfolio.columns = ['date', 'account_value']
-
-        meta_coefficient = pd.DataFrame(meta_coefficient).set_index("date")
+        # row offset of each date; slicing these presorted arrays gives
+        # the per-date views without any boolean masks or copies
+        offsets = np.concatenate(
+            ([0],
+             np.cumsum(test_data.groupby("date", sort=False).size().to_numpy())))
+        close_arr = np.ascontiguousarray(
+            test_data.close.to_numpy(dtype=np.float64))
+        tic_arr = test_data.tic.to_numpy()
+        return_windows = test_data.return_list.to_numpy()
+        # one batched prediction over the stacked feature matrix instead
+        # of one small predict call per date; going through coef_ directly
+        # skips sklearn's per-call input validation and reduces the whole
+        # linear term to a single GEMV
+        feat_arr = test_data[feature_list].to_numpy()
+        if hasattr(self.model, "coef_"):
+            # the indicators carry ~6 significant digits, so the
+            # predict-only GEMV runs in float32 (half the bytes moved,
+            # twice the SIMD lanes); training stays in float64
+            feat32 = feat_arr.astype(np.float32, copy=False)
+            coef32 = self.model.coef_.astype(np.float32)
+            mu_all = (feat32 @ coef32 + np.float32(
+                self.model.intercept_)).astype(np.float64)
+        else:
+            mu_all = self.model.predict(feat_arr)
+        # per-date weights are written into a preallocated matrix instead
+        # of growing per-ticker Python lists
+        weight_matrix = np.zeros(
+            (len(unique_trade_date) - 1, len(unique_tics)))
+        weight_arr = [np.full(len(unique_tics), 1/len(unique_tics))]
+        # plain float64 vector indexed by position; the portfolio frame is
+        # built once after the loop
+        account = np.empty(len(unique_trade_date), dtype=np.float64)
+        account[0] = initial_capital
+        if exact:
+            # first pass (sequential): per-date expected returns and
+            # Cholesky factors, maintained incrementally by the cov cache
+            mus, factors, tic_rows = [], [], []
+            for i in range(len(unique_trade_date) - 1):
+                mu, sigma, tics = self._return_predict(
+                    i, mu_all, offsets, tic_arr, return_windows)
+                mus.append(np.asarray(mu, dtype=np.float64).reshape(-1,))
+                factors.append((self._cov_state["L"].copy(), True))
+                tic_rows.append(tics)
+            # second pass: the only cross-date coupling is the linear
+            # transaction cost term, so the dates can be solved in
+            # parallel once the previous date's unadjusted tangency
+            # weights are used as w_prev
+            with Parallel(n_jobs=n_jobs, prefer="threads") as parallel:
+                base = parallel(delayed(_solve_tangency)(factor, mu)
+                                for factor, mu in zip(factors, mus))
+                prev = [weight_arr[0]] + base[:-1]
+                solved = parallel(
+                    delayed(_solve_tangency)(
+                        factor, mu, w_prev, transaction_cost_pct)
+                    for factor, mu, w_prev in zip(factors, mus, prev))
+            # sequential reduction over the per-date weights
+            for i, w_opt in enumerate(solved):
+                weight_matrix[
+                    i, [tic_to_idx[tic] for tic in tic_rows[i]]] = w_opt
+                account[i + 1] = _portfolio_step(
+                    w_opt, account[i],
+                    close_arr[offsets[i]:offsets[i + 1]],
+                    close_arr[offsets[i + 1]:offsets[i + 2]])
+        else:
+            for i in range(len(unique_trade_date) - 1):
+                mu, sigma, tics = self._return_predict(
+                    i, mu_all, offsets, tic_arr, return_windows)
+
+                account[i + 1], weight_arr = self._weight_optimization(
+                    i, weight_matrix, tic_to_idx, mu, sigma, tics, account[i],
+                    close_arr[offsets[i]:offsets[i + 1]],
+                    close_arr[offsets[i + 1]:offsets[i + 2]],
+                    transaction_cost_pct, weight_arr)
+
+        portfolio = pd.DataFrame(
+            {"date": unique_trade_date, "account_value": account})
+
+        meta_coefficient = pd.DataFrame(
+            weight_matrix,
+            index=pd.Index(unique_trade_date[:-1], name="date"),
+            columns=unique_tics)
         return portfolio, meta_coefficient
 
-    def _return_predict(self, unique_trade_date, test_data, i, feature_list):
-        """Predicts the expected return using  technical indicators.
+    def _return_predict(self, i, mu_all, offsets, tic_arr, return_windows):
+        """Looks up the expected return predicted for the current date.
             Helper function for the main predict method.
 
         Args:
-            unique_trade_date (datetime): unique dates in the test data
-            test_data (pd.DataFrame): test data
             i (int): index for the loop
-            feature_list (list) : a list of features to be used for prediction
+            mu_all (np.ndarray): batched predictions for the whole test data
+            offsets (np.ndarray): row offset of each date in the presorted
+            test data
+            tic_arr (np.ndarray): ticker of each presorted test data row
+            return_windows (np.ndarray): return_list entry of each row
 
         Returns:
-            pd.DataFrame: current date
-            pd.DataFrame: next date
-            list: tickers
             np.ndarray: predicted y_values (expected returns)
             np.ndarray: risk (covarience matrix)
+            np.ndarray: tickers
         """
 
-        current_date = unique_trade_date[i]
-        next_date = unique_trade_date[i + 1]
+        tics = tic_arr[offsets[i]:offsets[i + 1]]
+        mu = mu_all[offsets[i]:offsets[i + 1]]
+        sigma = self._update_cov_cache(return_windows[offsets[i]])
 
-        df_current = test_data[test_data.date ==
-                               current_date].reset_index(drop=True)
-        df_next = test_data[test_data.date ==
-                            next_date].reset_index(drop=True)
+        return mu, sigma, tics
 
-        tics = df_current['tic'].values
-        features = df_current[feature_list].values
+    def _update_cov_cache(self, returns, frequency=252):
+        """Computes the annualized sample covariance of the return window,
+            reusing the cached Cholesky factor where possible.
+            Helper function for _return_predict.
 
-        predicted_y = self.model.predict(features)
-        mu = predicted_y
-        sigma = risk_models.sample_cov(
-            df_current.return_list[0], returns_data=True)
+        The return window slides by one row between consecutive trade
+        dates, so instead of refactoring sigma from scratch (O(n^3)) the
+        cached lower factor is maintained with rank-1 operations (O(n^2)
+        each). With m rows, f the annualization factor and mean_old /
+        mean_new the window means before and after the slide, the exact
+        change of the annualized covariance is
 
-        return mu, sigma, tics, df_current, df_next
+            f (b b^T - a a^T) - f m (mean_new mean_new^T
+                                     - mean_old mean_old^T)
 
-    def _weight_optimization(self, i, unique_trade_date, meta_coefficient, mu, sigma, tics, portfolio, df_current, df_next, transaction_cost_pct, weight_arr):
-        """Optimizes weights using efficient frontier.
-            Helper function for the main predict method.
+        for appended row b and dropped row a, which is two updates and
+        two downdates — the mean-shift term is itself rank-2, so nothing
+        is approximated and the factor does not drift as the backtest
+        walks forward. A full recomputation is done whenever the window
+        does not line up with the cached one or a downdate fails.
+
+        Args:
+            returns (pd.DataFrame): return window of the current date
+            frequency (int) : trading days per year used for annualization
+
+        Returns:
+            np.ndarray: risk (covarience matrix)
+        """
+        window = np.ascontiguousarray(
+            np.asarray(returns), dtype=np.float64)
+        cached = self._cov_state["window"]
+        if (cached is not None and cached.shape == window.shape
+                and np.array_equal(cached[1:], window[:-1])):
+            L = self._cov_state["L"]
+            m = window.shape[0]
+            f = frequency / (m - 1)
+            a, b = cached[0], window[-1]
+            mean_old = cached.mean(axis=0)
+            mean_new = mean_old + (b - a) / m
+            try:
+                # updates before downdates keeps the intermediate factors
+                # positive-definite
+                _chol_update(L, np.sqrt(f) * b, sign=1.0)
+                _chol_update(L, np.sqrt(f * m) * mean_old, sign=1.0)
+                _chol_update(L, np.sqrt(f) * a, sign=-1.0)
+                _chol_update(L, np.sqrt(f * m) * mean_new, sign=-1.0)
+                self._cov_state["window"] = window
+                return L @ L.T
+            except np.linalg.LinAlgError:
+                pass
+        # annualized sample covariance computed directly on the ndarray;
+        # dsyrk exploits symmetry to do R^T R in half the flops of a gemm
+        # and skips pypfopt's DataFrame wrapping entirely
+        demeaned = window - window.mean(axis=0)
+        sigma = scipy.linalg.blas.dsyrk(
+            frequency / (window.shape[0] - 1), demeaned, trans=1, lower=1)
+        sigma = sigma + sigma.T - np.diag(np.diag(sigma))
+        L = np.linalg.cholesky(sigma + 1e-8 * np.eye(sigma.shape[0]))
+        self._cov_state["L"] = L
+        self._cov_state["window"] = window
+        return sigma
+
+    def _weight_optimization(self, i, weight_matrix, tic_to_idx, mu, sigma, tics, cap, close_curr, close_next, transaction_cost_pct, weight_arr):
+        """Optimizes weights with the iterative SLSQP optimizer.
+            Helper function for the exact=False path of the main predict
+            method; the exact path solves all dates at once with
+            _solve_tangency.
 
         Args:
             i (int): index for the loop
-            unique_trade_date (datetime): unique dates in the test data
-            meta_coefficient (pd.DataFrame): empty DataFrame to be filled with weights and tickers.
+            weight_matrix (np.ndarray): preallocated (dates x tickers) matrix
+            the optimized weights are written into
+            tic_to_idx (dict): maps each ticker to its weight_matrix column
             mu (pd.Series): predicted y values (expected returns)
             sigma (np.ndarray): covarience matrix
             tics (list): tickers
-            portfolio (pd.DataFrame): DataFrame to hold portfolio info
-            df_current (pd.DataFrame): current date
-            df_next (pd.DataFrame): next date
+            cap (float): account value at the current date
+            close_curr (np.ndarray): close prices at the current date
+            close_next (np.ndarray): close prices at the next date
             transaction_cost_pct (float) : transaction cost
             weight_arr (np.array) : initial weights
 
         Returns:
-            pd.DataFrame: portfolio 
+            float: account value at the next date
         """
-        current_date = unique_trade_date[i]
-        predicted_y_df = pd.DataFrame(
-            {"tic": tics.reshape(-1,), "predicted_y": mu.reshape(-1,)})
         min_weight, max_weight = 0, 1
 
-        ef = EfficientFrontier(mu, sigma)
-        w_prev = np.array(weight_arr[-1], dtype=object)
-        ef.add_objective(objective_functions.transaction_cost,
-                         w_prev=w_prev, k=transaction_cost_pct)
-        weights = ef.nonconvex_objective(
-            objective_functions.sharpe_ratio,
-            objective_args=(ef.expected_returns, ef.cov_matrix),
-            weights_sum_to_one=True,
-            constraints=[
-                # greater than min_weight
-                {"type": "ineq", "fun": lambda w: w - min_weight},
-                # less than max_weight
-                {"type": "ineq", "fun": lambda w: max_weight - w},
-            ],
+        w_prev = np.asarray(weight_arr[-1], dtype=np.float64)
+        mu_arr = np.asarray(mu, dtype=np.float64).reshape(-1,)
+        sigma_arr = np.asarray(sigma, dtype=np.float64)
+        result = scipy.optimize.minimize(
+            _neg_sharpe,
+            # warm-start from the previous date's weights
+            x0=w_prev,
+            args=(mu_arr, sigma_arr, w_prev, transaction_cost_pct),
+            jac=_neg_sharpe_grad,
+            method="SLSQP",
+            bounds=scipy.optimize.Bounds(min_weight, max_weight),
+            constraints=scipy.optimize.LinearConstraint(
+                np.ones(len(mu_arr)), 1, 1),
         )
-
-        weight_df = {"tic": [], "weight": []}
-        meta_coefficient["date"] += [current_date]
-
-        for item in weights:
-            weight_df['tic'] += [item]
-            weight_df['weight'] += [weights[item]]
-
-        weight_df = pd.DataFrame(weight_df).merge(predicted_y_df, on=['tic'])
-
-        tics_list = list(weight_df['tic'])
-        weights_list = list(weight_df['weight'])
-        new_weights = []
-        for j in range(len(tics_list)):
-            meta_coefficient[tics_list[j]] += [weights_list[j]]
-            new_weights.append(weights_list[j])
+        # w_opt is already aligned with tics and stays float64 end to end
+        new_weights = np.asarray(
+            result.x / result.x.sum(), dtype=np.float64)
+        weight_matrix[i, [tic_to_idx[tic] for tic in tics]] = new_weights
         weight_arr.append(new_weights)
-        cap = portfolio.iloc[0, i]
-        # current cash invested for each stock
-        current_cash = [element * cap for element in list(weights.values())]
-        # current held shares
-        current_shares = list(np.array(current_cash) /
-                              np.array(df_current.close))
-        # next time period price
-        next_price = np.array(df_next.close)
-        portfolio.iloc[0, i+1] = np.dot(current_shares, next_price)
-
-        return portfolio, weight_arr
+
+        return _portfolio_step(new_weights, cap, close_curr, close_next), weight_arr
 
     def save_model(self, file_name):
         """Saves the model
@@ -250,7 +508,7 @@ class HRAgent(ConventionalAgent):
             file_name (str): file name for saving the model
         """
         with open(file_name, 'wb') as files:
-            pickle.dump(self.model, files)
+            pickle.dump(self.model, files, protocol=5)
         print("Model saved succesfully.")
 
     def load_model(self, file_name):
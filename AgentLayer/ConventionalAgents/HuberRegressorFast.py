@@ -0,0 +1,120 @@
+import numpy as np
+
+try:
+    from skglm import GeneralizedLinearEstimator
+    from skglm.datafits import Huber
+    from skglm.penalties import L2
+    from skglm.solvers import AndersonCD
+    SKGLM_AVAILABLE = True
+except ImportError:
+    SKGLM_AVAILABLE = False
+
+
+class HuberRegressorFast:
+    """Huber regression backed by skglm's Numba-jitted coordinate descent.
+
+    Drop-in substitute for sklearn's HuberRegressor in HRAgent: sklearn
+    fits the Huber loss with L-BFGS-B over a Python objective, while
+    skglm runs jitted Anderson-accelerated coordinate descent epochs,
+    which is considerably faster on moderate feature counts. The fitted
+    estimator exposes the same predict/get_params/coef_/intercept_
+    surface that HRAgent relies on.
+
+    Attributes
+    ----------
+        model : skglm.GeneralizedLinearEstimator
+            the wrapped estimator
+
+    Methods
+    -------
+        fit()
+            fits the estimator.
+        predict()
+            predicts with the fitted estimator.
+        get_params()
+            Get parameters for this estimator.
+    """
+
+    def __init__(self,
+                 epsilon=1.35,
+                 max_iter=1000,
+                 alpha=0.0001,
+                 fit_intercept=True,
+                 tol=1e-05):
+        """Initialize HuberRegressorFast object.
+
+        Args:
+            epsilon (float, optional): The parameter epsilon controls the number of samples that should be classified as outliers. Defaults to 1.35.
+            max_iter (int, optional): Maximum number of solver iterations. Defaults to 1000.
+            alpha (float, optional): Regularization parameter. Defaults to 0.0001.
+            fit_intercept (bool, optional): Whether or not to fit the intercept. Defaults to True.
+            tol (float, optional): Solver tolerance. Defaults to 1e-05.
+
+        Raises:
+            ImportError: if the optional skglm package is not installed.
+        """
+        if not SKGLM_AVAILABLE:
+            raise ImportError(
+                "HuberRegressorFast requires the optional skglm package; "
+                "install skglm or use the sklearn backend")
+        self.model = GeneralizedLinearEstimator(
+            datafit=Huber(delta=epsilon),
+            penalty=L2(alpha),
+            solver=AndersonCD(max_iter=max_iter,
+                              tol=tol,
+                              fit_intercept=fit_intercept))
+
+    @property
+    def coef_(self):
+        return np.ravel(self.model.coef_)
+
+    @property
+    def intercept_(self):
+        return self.model.intercept_
+
+    def fit(self, X, y, sample_weight=None):
+        """Fits the estimator.
+
+        Args:
+            X (np.ndarray): training features
+            y (np.ndarray): training targets
+            sample_weight (np.ndarray, optional): accepted for signature
+            compatibility with HuberRegressor (the stock train params
+            pass it as None); skglm's solver cannot weight samples, so
+            any non-None value is rejected. Defaults to None.
+
+        Returns:
+            HuberRegressorFast: the fitted estimator
+
+        Raises:
+            ValueError: if sample_weight is not None.
+        """
+        if sample_weight is not None:
+            raise ValueError(
+                "HuberRegressorFast does not support sample_weight; "
+                "use the sklearn backend for weighted fits")
+        self.model.fit(np.asarray(X, dtype=np.float64),
+                       np.asarray(y, dtype=np.float64).ravel())
+        return self
+
+    def predict(self, X):
+        """Predicts with the fitted estimator.
+
+        Args:
+            X (np.ndarray): features
+
+        Returns:
+            np.ndarray: predictions
+        """
+        return self.model.predict(X)
+
+    def get_params(self, deep=True):
+        """Get parameters for this estimator.
+
+        Args:
+            deep (bool, optional): If True, will return the parameters for this estimator and contained subobjects that are estimators. Defaults to True.
+
+        Returns:
+            dict: parameters
+        """
+        return self.model.get_params(deep=deep)
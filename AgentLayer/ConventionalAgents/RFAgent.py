@@ -148,7 +148,7 @@ class RFAgent(ConventionalAgent):
         """
 
         meta_coefficient = {"date": []}
-        for i in test_data.tic:
+        for i in test_data.tic.unique():
             meta_coefficient[i] = []
         unique_trade_date = test_data.date.unique()
         weight_arr = [
@@ -283,7 +283,7 @@ class RFAgent(ConventionalAgent):
             file_name (str): file name for saving the model
         """
         with open(file_name, 'wb') as files:
-            pickle.dump(self.model, files)
+            pickle.dump(self.model, files, protocol=5)
         print("Model saved succesfully.")
 
     def load_model(self, file_name):
@@ -128,7 +128,7 @@ class SVRAgent(ConventionalAgent):
             and predicted y value.
         """
         meta_coefficient = {"date": []}
-        for i in test_data.tic:
+        for i in test_data.tic.unique():
             meta_coefficient[i] = []
         unique_trade_date = test_data.date.unique()
         weight_arr = [
@@ -265,7 +265,7 @@ class SVRAgent(ConventionalAgent):
             file_name (str): file name for saving the model
         """
         with open(file_name, 'wb') as files:
-            pickle.dump(self.model, files)
+            pickle.dump(self.model, files, protocol=5)
         print("Model saved succesfully.")
 
     def load_model(self, file_name):
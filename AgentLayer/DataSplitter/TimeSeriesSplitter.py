@@ -1,3 +1,4 @@
+import numpy as np
 from sklearn.model_selection import TimeSeriesSplit
 
 
@@ -67,27 +68,54 @@ class TimeSeriesSplitter(TimeSeriesSplit):
 
         Returns:
             pd.DataFrame: split data
+
+        Note:
+            When df is already sorted by date (the usual case for time
+            series data) the boundaries are found with an O(log N) binary
+            search and a contiguous slice; otherwise the original O(N)
+            boolean mask is used.
         """
-        data = df[(df[target_date_col] >= start) & (df[target_date_col] <= end)]
+        dates = df[target_date_col].values
+        if np.issubdtype(dates.dtype, np.datetime64):
+            start, end = np.datetime64(start), np.datetime64(end)
+        if df[target_date_col].is_monotonic_increasing:
+            lo = np.searchsorted(dates, start, side="left")
+            hi = np.searchsorted(dates, end, side="right")
+            data = df.iloc[lo:hi]
+        else:
+            data = df[(df[target_date_col] >= start)
+                      & (df[target_date_col] <= end)]
         data = data.sort_values([target_date_col, "tic"], ignore_index=True)
         data.index = data[target_date_col].factorize()[0]
         return data
 
     @staticmethod
-    def get_next_df_date(df, date, day=1):
+    def get_next_df_date(df, date, day=1, sorted_unique_dates=None):
         """Gets the next date in the given dataframe
 
+        Instead of masking the whole dataframe on every call, the sorted
+        unique dates are computed once, stashed on the dataframe via
+        df.attrs, and looked up with an O(log N) binary search. Repeated
+        walk-forward calls on the same dataframe reuse the cached index.
+
         Args:
             df (pd.DataFrame): Dataframe containing financial data
             date (str): start date
-            day (int): end date
+            day (int): how many dates to advance. Defaults to 1.
+            sorted_unique_dates (np.ndarray, optional): presorted unique
+            dates of df; computed and cached on df.attrs when omitted.
 
         Returns:
-            next date in the Dataframe
+            next date in the Dataframe, or -1 when there is none
         """
-        index = df[df["date"] > date].index.unique()
-        if len(df.index) > 0:
-            index_of_next_date = index[day - 1]
-            return df.loc[index_of_next_date].date.unique()[0]
+        if sorted_unique_dates is None:
+            sorted_unique_dates = df.attrs.get("_unique_dates")
+            if sorted_unique_dates is None:
+                sorted_unique_dates = np.sort(df["date"].unique())
+                df.attrs["_unique_dates"] = sorted_unique_dates
+        index_of_next_date = np.searchsorted(
+            sorted_unique_dates, date, side="right") + day - 1
+        if index_of_next_date < len(sorted_unique_dates):
+            return sorted_unique_dates[index_of_next_date]
         else:
             return -1
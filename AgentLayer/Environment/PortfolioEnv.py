@@ -75,6 +75,8 @@ class PortfolioEnv(Environment):
             return account value at each time step
         save_action_memory()
             return actions/positions at each time step
+        save_memories()
+            return both memories with one call
         get_env()
             generates environment.
 
@@ -139,12 +141,12 @@ class PortfolioEnv(Environment):
         self.observation_space = spaces.Box(low=-np.inf, high=np.inf,
                                             shape=(self.state_space + len(self.feature_list), self.state_space))
 
-        # load data from a pandas dataframe
-
+        # load data from a pandas dataframe; per-day states, close prices
+        # and dates are materialized once so step() never re-enters pandas
+        self._build_day_cache()
         self.data = self.df.loc[self.day, :]
-        self.covs = self.data['cov_list'].values[0]
-        self.state = np.append(np.array(self.covs), [
-                               self.data[feat].values.tolist() for feat in self.feature_list], axis=0)
+        self.covs = self._states[self.day][:self.stock_dim]
+        self.state = self._states[self.day]
         self.terminal = False
         #self.turbulence_threshold = turbulence_threshold
         # initalize state: initial portfolio return + individual stock return + individual weights
@@ -155,7 +157,28 @@ class PortfolioEnv(Environment):
         # memorize portfolio return each step
         self.portfolio_return_memory = [0]
         self.actions_memory = [[1 / self.stock_dim] * self.stock_dim]
-        self.date_memory = [self.data.date.unique()[0]]
+        self.date_memory = [self._dates[0]]
+
+    def _build_day_cache(self):
+        """Precomputes per-day states, close prices and dates.
+
+        step() previously re-entered pandas on every call — a df.loc
+        lookup plus per-feature list building — which dominated its cost.
+        The observation block, close-price row and date of each day are
+        fixed by the input dataframe, so they are built once here and
+        step() reduces to numpy indexing on the cached arrays.
+        """
+        self._n_days = len(self.df.index.unique())
+        self._states = []
+        self._closes = np.empty((self._n_days, self.stock_dim))
+        self._dates = []
+        for day in range(self._n_days):
+            data = self.df.loc[day, :]
+            covs = data['cov_list'].values[0]
+            self._states.append(np.append(np.array(covs), [
+                data[feat].values.tolist() for feat in self.feature_list], axis=0))
+            self._closes[day] = data.close.values
+            self._dates.append(data.date.unique()[0])
 
     def reset(self):
         """Resets the envrionment
@@ -166,16 +189,15 @@ class PortfolioEnv(Environment):
         self.asset_memory = [self.initial_amount]
         self.day = 0
         self.data = self.df.loc[self.day, :]
-        # load states
-        self.covs = self.data['cov_list'].values[0]
-        self.state = np.append(np.array(self.covs), [
-                               self.data[feat].values.tolist() for feat in self.feature_list], axis=0)
+        # load states from the day cache
+        self.covs = self._states[self.day][:self.stock_dim]
+        self.state = self._states[self.day]
 
         self.portfolio_value = self.initial_amount
         self.terminal = False
         self.portfolio_return_memory = [0]
         self.actions_memory = [[1/self.stock_dim] * self.stock_dim]
-        self.date_memory = [self.data.date.unique()[0]]
+        self.date_memory = [self._dates[0]]
         return self.state
 
     def step(self, actions):
@@ -189,7 +211,7 @@ class PortfolioEnv(Environment):
             bool : if terminal state
 
         """
-        self.terminal = self.day >= len(self.df.index.unique()) - 1
+        self.terminal = self.day >= self._n_days - 1
         if self.terminal:
             df = pd.DataFrame(self.portfolio_return_memory)
             df.columns = ['daily_return']
@@ -210,17 +232,15 @@ class PortfolioEnv(Environment):
         else:
             weights = Environment.softmax_normalization(actions)
             self.actions_memory.append(weights)
-            transaction_fee = self.transaction_cost_pct * self.asset_memory[-1] * sum(
-                [abs(a_i - b_i) for a_i, b_i in zip(self.actions_memory[-1], self.actions_memory[-2])])  # transaction_fee
-            last_day_memory = self.data
-            # load next state
+            transaction_fee = self.transaction_cost_pct * self.asset_memory[-1] * np.abs(
+                np.asarray(self.actions_memory[-1]) - np.asarray(self.actions_memory[-2])).sum()  # transaction_fee
+            last_close = self._closes[self.day]
+            # load next state from the day cache
             self.day += 1
-            self.data = self.df.loc[self.day, :]
-            self.covs = self.data['cov_list'].values[0]
-            self.state = np.append(np.array(self.covs), [
-                                   self.data[feat].values.tolist() for feat in self.feature_list], axis=0)
-            portfolio_return = sum(
-                ((self.data.close.values / last_day_memory.close.values) - 1) * weights)
+            self.covs = self._states[self.day][:self.stock_dim]
+            self.state = self._states[self.day]
+            portfolio_return = (
+                (self._closes[self.day] / last_close) - 1).dot(weights)
             # update portfolio value
             new_portfolio_value = self.portfolio_value * \
                 (1 + portfolio_return) - transaction_fee  # transaction_fee
@@ -228,7 +248,7 @@ class PortfolioEnv(Environment):
 
             # save into memory
             self.portfolio_return_memory.append(portfolio_return)
-            self.date_memory.append(self.data["date"].unique()[0])
+            self.date_memory.append(self._dates[self.day])
             self.asset_memory.append(new_portfolio_value)
 
             # the reward is the new portfolio value or end portfolio value
@@ -277,6 +297,19 @@ class PortfolioEnv(Environment):
         # df_actions = pd.DataFrame({'date':date_list,'actions':action_list})
         return df_actions
 
+    def save_memories(self):
+        """Returns asset and action memories in one call
+
+        Fetching both through a single env_method call halves the
+        vec-env round-trips at the end of a rollout, which matters once
+        the env sits behind SubprocVecEnv-style IPC.
+
+        Returns:
+            pd.DataFrame : account value
+            pd.DataFrame : actions
+        """
+        return self.save_asset_memory(), self.save_action_memory()
+
     def get_env(self):
         """Creates the envrionment
 
@@ -3,8 +3,11 @@ from stable_baselines3.common.vec_env import DummyVecEnv
 from stable_baselines3 import TD3 as sb_TD3
 from stable_baselines3.common.noise import ActionNoise
 from stable_baselines3.common.buffers import ReplayBuffer
+from AgentLayer.RLAgents.FastReplayBuffer import FastReplayBuffer
 from AgentLayer.RLAgents.RLAgent import RLAgent
 from typing import Any, Dict, Optional, Tuple, Type, Union
+import numpy as np
+import pandas as pd
 import torch as th
 
 
@@ -44,7 +47,7 @@ class TD3(RLAgent):
                  action_noise: Optional[ActionNoise] = None,
                  replay_buffer_class: Optional[ReplayBuffer] = None,
                  replay_buffer_kwargs: Optional[Dict[str, Any]] = None,
-                 optimize_memory_usage: bool = False,
+                 optimize_memory_usage: bool = True,
                  policy_delay: int = 2,
                  target_policy_noise: float = 0.02,
                  target_noise_clip: float = 0.05,
@@ -54,7 +57,9 @@ class TD3(RLAgent):
                  verbose: int = 0,
                  seed: Optional[int] = None,
                  device: Union[th.device, str] = "auto",
-                 _init_setup_model: bool = True):
+                 _init_setup_model: bool = True,
+                 compile_actor: bool = False,
+                 use_amp: bool = False):
         """Initializer for TD3 Object.
 
         Args:
@@ -70,7 +75,11 @@ class TD3(RLAgent):
             action_noise (Optional[ActionNoise], optional): the action noise type. Defaults to None.
             replay_buffer_class (Optional[ReplayBuffer], optional): Replay buffer class to use. Defaults to None.
             replay_buffer_kwargs (Optional[Dict[str, Any]], optional): Keyword arguments to pass to the replay buffer on creation. Defaults to None.
-            optimize_memory_usage (bool, optional): Enable a memory efficient variant of the replay buffer at a cost of more complexity. Defaults to False.
+            optimize_memory_usage (bool, optional): Enable a memory efficient variant of the replay buffer at a cost of more complexity:
+            next observations are read from the following slot of the circular buffer instead of being stored twice, halving replay memory.
+            Incompatible with HER replay and with the buffer's timeout handling, so enabling it turns
+            handle_timeout_termination off unless replay_buffer_kwargs says otherwise; PortfolioEnv never emits
+            TimeLimit.truncated, so nothing is lost. Defaults to True.
             policy_delay(int,optional) : Policy and target networks will only be updated once every policy_delay steps per training steps. Defaults to 2.
             target_policy_noise (float,optional) : Standard deviation of Gaussian noise added to target policy (smoothing noise). Defaults to 0.02
             target_noise_clip (float,optional) : Limit for absolute value of target policy smoothing noise. Defaults to 0.05
@@ -81,9 +90,26 @@ class TD3(RLAgent):
             seed (Optional[int], optional): Seed for the pseudo random generators. Defaults to None.
             device (Union[th.device, str], optional):  on which the code should be run. Defaults to "auto".
             _init_setup_model (bool, optional): Whether or not to build the network at the creation of the instance. Defaults to True.
+            compile_actor (bool, optional): Compile the actor network with torch.compile (reduce-overhead mode) to cut the per-step
+            inference launch overhead. Requires torch >= 2.0; ignored on older versions. Defaults to False.
+            use_amp (bool, optional): Run actor inference during predict under torch.autocast with bfloat16. Halves the
+            memory bandwidth of the forward pass on Ampere-class GPUs; training and the critic stay in float32. Ignored
+            when CUDA is unavailable. Defaults to False.
         """
 
         self.env = env
+        self._use_amp = use_amp and th.cuda.is_available()
+
+        if replay_buffer_class is None:
+            replay_buffer_class = FastReplayBuffer
+
+        if optimize_memory_usage:
+            # SB3 rejects the shared circular-buffer layout combined with
+            # timeout handling (the shared slot holds the wrong next_obs
+            # for truncated episodes), so default the latter off
+            replay_buffer_kwargs = dict(replay_buffer_kwargs or {})
+            replay_buffer_kwargs.setdefault(
+                "handle_timeout_termination", False)
 
         self.model = sb_TD3(policy=policy,
                             env=self.env,
@@ -110,6 +136,17 @@ class TD3(RLAgent):
                             device=device,
                             _init_setup_model=_init_setup_model)
 
+        if compile_actor and hasattr(th, "compile"):
+            # compile the bound forward rather than swapping the module:
+            # registering the OptimizedModule in its place prefixes every
+            # policy state-dict key with actor._orig_mod and breaks
+            # save/load round-trips
+            actor = self.model.policy.actor
+            actor.forward = th.compile(
+                actor.forward,
+                mode="reduce-overhead",
+                fullgraph=True)
+
     def train_model(self, **train_params):
         """Trains the model
 
@@ -122,6 +159,22 @@ class TD3(RLAgent):
         self.model = self.model.learn(**train_params)
         return self.model
 
+    def _predict_obs(self, obs, **test_params):
+        """Runs one policy forward, under bfloat16 autocast when enabled.
+
+        Args:
+            obs (np.ndarray): observation batch
+            test_params (dict) : test parameters
+
+        Returns:
+            np.ndarray: actions
+            np.ndarray: policy states
+        """
+        if self._use_amp:
+            with th.autocast(device_type="cuda", dtype=th.bfloat16):
+                return self.model.predict(obs, **test_params)
+        return self.model.predict(obs, **test_params)
+
     def predict(self, environment, **test_params):
         """Does the prediction
 
@@ -135,33 +188,113 @@ class TD3(RLAgent):
         """
 
         env_test, obs_test = environment.get_env()
-        account_memory = []
-        actions_memory = []
-
+        # nunique() is computed once up front; unique() rebuilt a hashed
+        # index on every loop iteration
+        n_steps = environment.df.index.nunique()
         env_test.reset()
-        for i in range(len(environment.df.index.unique())):
-            action, _states = self.model.predict(obs_test, **test_params)
+        for i in range(n_steps - 1):
+            action, _states = self._predict_obs(obs_test, **test_params)
             obs_test, rewards, dones, info = env_test.step(action)
-            if i == (len(environment.df.index.unique()) - 2):
-                account_memory = env_test.env_method(
-                    method_name="save_asset_memory")
-                actions_memory = env_test.env_method(
-                    method_name="save_action_memory")
-            if dones[0]:
-                print("hit end!")
-                break
-
-        portfolio_df = account_memory[0]
-        portfolio_df = portfolio_df.rename(
-            columns={"daily_return": "account_value"})
-        portfolio_df.iloc[0, portfolio_df.columns.get_loc(
-            "account_value")] = environment.initial_amount
-        values = list(portfolio_df["account_value"])
-        for i in range(1, len(values)):
-            values[i] = (values[i] + 1) * values[i-1]
-
-        portfolio_df["account_value"] = values
-        return portfolio_df, actions_memory[0]
+
+        # one env_method round-trip for both memories, fetched before the
+        # terminal step: DummyVecEnv auto-resets on done, which would
+        # clear them
+        account_memory, actions_memory = env_test.env_method(
+            method_name="save_memories")[0]
+        action, _states = self._predict_obs(obs_test, **test_params)
+        obs_test, rewards, dones, info = env_test.step(action)
+        if dones[0]:
+            print("hit end!")
+
+        # compound the daily returns in one vectorized pass and build the
+        # output frame once; the first entry carries no return, so the
+        # series starts at initial_amount
+        returns = account_memory["daily_return"].values
+        returns[0] = 0.0
+        portfolio_df = pd.DataFrame({
+            "date": account_memory["date"].values,
+            "account_value": environment.initial_amount *
+            np.cumprod(1.0 + returns)})
+        return portfolio_df, actions_memory
+
+    def predict_vectorized(self, environment, **test_params):
+        """Batched prediction over the whole test horizon.
+
+        PortfolioEnv observations are built from the dataframe alone —
+        no state depends on the action taken — so the sequential
+        env.step loop is not actually required to obtain the policy's
+        weights. This fast path stacks the observations already held in
+        the env's day cache, runs a
+        single batched actor forward over them (one device round-trip
+        instead of T), applies the softmax weight normalization across
+        the batch, and compounds the daily returns in one vectorized
+        pass. The returned frames match predict(): daily returns exclude
+        transaction fees, which only enter the training reward.
+
+        Args:
+            environment (PortfolioEnv): test environment
+            test_params (dict) : test parameters
+
+        Returns:
+            pd.DataFrame: portfolio
+            pd.DataFrame: actions memory
+        """
+        # the env's day cache already holds every observation block,
+        # close-price row and date, so no pandas work is needed here
+        n_steps = environment._n_days
+        states = np.stack(environment._states).astype(np.float32)
+        closes = environment._closes
+        dates = list(environment._dates)
+
+        actions, _states = self._predict_obs(states, **test_params)
+        # batched softmax, same normalization the env applies per step
+        exp = np.exp(actions - actions.max(axis=1, keepdims=True))
+        weights = exp / exp.sum(axis=1, keepdims=True)
+
+        returns = np.zeros(n_steps)
+        returns[1:] = np.einsum(
+            "td,td->t", closes[1:] / closes[:-1] - 1.0, weights[:-1])
+        portfolio_df = pd.DataFrame({
+            "date": dates,
+            "account_value": environment.initial_amount *
+            np.cumprod(1.0 + returns)})
+
+        # first row is the equal-weight starting allocation, as in
+        # PortfolioEnv.save_action_memory
+        action_rows = np.vstack([
+            np.full((1, environment.stock_dim), 1.0 / environment.stock_dim),
+            weights[:-1]])
+        df_actions = pd.DataFrame(action_rows,
+                                  index=pd.Index(dates, name="date"),
+                                  columns=environment.df.loc[0, :].tic.values)
+        return portfolio_df, df_actions
+
+    @classmethod
+    def from_pretrained(cls, path, env=None, device="auto"):
+        """Builds an agent straight from a saved model.
+
+        Going through __init__ followed by load_model constructs a full
+        sb_TD3 — policy networks, optimizers and the replay buffer —
+        only to replace it with the loaded one. This constructor skips
+        the throwaway build and loads the saved model directly, which
+        for large buffer_size configs avoids allocating gigabytes that
+        are freed a moment later.
+
+        Args:
+            path (str): path of the saved model.
+            env (DummyVecEnv, optional): environment to attach to the
+            loaded model; not needed for prediction. Defaults to None.
+            device (Union[th.device, str], optional): device on which the
+            loaded model should run. Defaults to "auto".
+
+        Returns:
+            TD3: agent wrapping the loaded model
+        """
+        agent = cls.__new__(cls)
+        agent.env = env
+        agent._use_amp = False
+        agent.model = sb_TD3.load(path, env=env, device=device)
+        return agent
 
     def load_model(self, path):
         """Loads the model
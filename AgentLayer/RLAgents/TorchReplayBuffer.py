@@ -0,0 +1,158 @@
+import numpy as np
+import torch as th
+from stable_baselines3.common.buffers import BaseBuffer
+from stable_baselines3.common.type_aliases import ReplayBufferSamples
+
+
+class TorchReplayBuffer(BaseBuffer):
+    """Replay buffer whose storage lives on the training device.
+
+    The default SB3 buffer keeps numpy storage on the host, draws batch
+    indices with np.random.randint and copies every sampled minibatch to
+    the device, paying one host-to-device transfer per gradient step.
+    Here each transition is copied to the device once on add, indices are
+    drawn with torch.randint directly on the device, and batches are
+    gathered with index_select, so the training loop never crosses the
+    CPU/GPU boundary.
+
+    VecNormalize statistics are not applied when sampling; use the
+    default buffer if the env is wrapped in VecNormalize.
+
+    Attributes
+    ----------
+        see stable_baselines3.common.buffers.BaseBuffer
+
+    Methods
+    -------
+        add()
+            copies one transition into the device-resident storage.
+        sample()
+            draws a minibatch with device-side indices.
+        _get_samples()
+            gathers the sampled transitions with index_select.
+    """
+
+    def __init__(self,
+                 buffer_size,
+                 observation_space,
+                 action_space,
+                 device="auto",
+                 n_envs=1,
+                 optimize_memory_usage=False,
+                 handle_timeout_termination=True):
+        """Initializer for TorchReplayBuffer object.
+
+        Args:
+            buffer_size (int): max number of transitions in the buffer
+            observation_space (gym.spaces.Space): observation space
+            action_space (gym.spaces.Space): action space
+            device (str, optional): device holding the storage and the sampled batches. Defaults to "auto".
+            n_envs (int, optional): number of parallel envs. Defaults to 1.
+            optimize_memory_usage (bool, optional): share storage between obs and next_obs. Defaults to False.
+            handle_timeout_termination (bool, optional): handle TimeLimit truncation separately. Defaults to True.
+        """
+        super().__init__(buffer_size, observation_space,
+                         action_space, device, n_envs=n_envs)
+        self.optimize_memory_usage = optimize_memory_usage
+        self.handle_timeout_termination = handle_timeout_termination
+
+        self.observations = th.zeros(
+            (self.buffer_size, self.n_envs) + self.obs_shape,
+            dtype=th.float32, device=self.device)
+        if not optimize_memory_usage:
+            self.next_observations = th.zeros_like(self.observations)
+        self.actions = th.zeros(
+            (self.buffer_size, self.n_envs, self.action_dim),
+            dtype=th.float32, device=self.device)
+        self.rewards = th.zeros(
+            (self.buffer_size, self.n_envs),
+            dtype=th.float32, device=self.device)
+        self.dones = th.zeros(
+            (self.buffer_size, self.n_envs),
+            dtype=th.float32, device=self.device)
+        self.timeouts = th.zeros(
+            (self.buffer_size, self.n_envs),
+            dtype=th.float32, device=self.device)
+
+    def add(self, obs, next_obs, action, reward, done, infos) -> None:
+        """Copies one transition into the device-resident storage.
+
+        Args:
+            obs (np.ndarray): observation
+            next_obs (np.ndarray): next observation
+            action (np.ndarray): action
+            reward (np.ndarray): reward
+            done (np.ndarray): episode termination flag
+            infos (list): per-env info dicts
+        """
+        self.observations[self.pos].copy_(
+            th.as_tensor(np.asarray(obs)))
+        if self.optimize_memory_usage:
+            self.observations[(self.pos + 1) % self.buffer_size].copy_(
+                th.as_tensor(np.asarray(next_obs)))
+        else:
+            self.next_observations[self.pos].copy_(
+                th.as_tensor(np.asarray(next_obs)))
+        self.actions[self.pos].copy_(th.as_tensor(
+            np.asarray(action).reshape(self.n_envs, self.action_dim)))
+        self.rewards[self.pos].copy_(
+            th.as_tensor(np.asarray(reward, dtype=np.float32)))
+        self.dones[self.pos].copy_(
+            th.as_tensor(np.asarray(done, dtype=np.float32)))
+        if self.handle_timeout_termination:
+            self.timeouts[self.pos].copy_(th.as_tensor(np.array(
+                [info.get("TimeLimit.truncated", False) for info in infos],
+                dtype=np.float32)))
+
+        self.pos += 1
+        if self.pos == self.buffer_size:
+            self.full = True
+            self.pos = 0
+
+    def sample(self, batch_size, env=None):
+        """Draws a minibatch with indices generated on the device.
+
+        Args:
+            batch_size (int): number of transitions to sample
+            env (VecNormalize, optional): ignored; see class docstring
+
+        Returns:
+            ReplayBufferSamples: the sampled batch as device tensors
+        """
+        if self.optimize_memory_usage and self.full:
+            # never sample self.pos: its next observation was overwritten
+            batch_inds = (th.randint(
+                1, self.buffer_size, (batch_size,), device=self.device)
+                + self.pos) % self.buffer_size
+        else:
+            upper_bound = self.buffer_size if self.full else self.pos
+            batch_inds = th.randint(
+                0, upper_bound, (batch_size,), device=self.device)
+        return self._get_samples(batch_inds, env=env)
+
+    def _get_samples(self, batch_inds, env=None):
+        """Gathers the sampled transitions with index_select.
+
+        Args:
+            batch_inds (th.Tensor): sampled buffer indices on the device
+            env (VecNormalize, optional): ignored; see class docstring
+
+        Returns:
+            ReplayBufferSamples: the sampled batch as device tensors
+        """
+        if self.optimize_memory_usage:
+            next_obs = self.observations.index_select(
+                0, (batch_inds + 1) % self.buffer_size)[:, 0]
+        else:
+            next_obs = self.next_observations.index_select(
+                0, batch_inds)[:, 0]
+        dones = (self.dones.index_select(0, batch_inds)
+                 * (1 - self.timeouts.index_select(0, batch_inds))
+                 ).reshape(-1, 1)
+        return ReplayBufferSamples(
+            self.observations.index_select(0, batch_inds)[:, 0],
+            self.actions.index_select(0, batch_inds)[:, 0],
+            next_obs,
+            dones,
+            self.rewards.index_select(0, batch_inds).reshape(-1, 1),
+        )
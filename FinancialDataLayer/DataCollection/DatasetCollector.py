@@ -1,8 +1,14 @@
 import json
+import os
 from abc import ABC, abstractmethod
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DatasetCollector(ABC):
     """"
@@ -40,36 +46,130 @@ class DatasetCollector(ABC):
         return df_to_load
 
     @staticmethod
-    def load_from_file(path) -> pd.DataFrame:
+    def _load_csv(path, dtype=None, usecols=None, parse_dates=None) -> pd.DataFrame:
+        """Loads a csv file, preferring the multithreaded pyarrow parser.
+
+        The pyarrow engine parses in parallel with vectorized number
+        conversion, which is markedly faster than the single-threaded C
+        engine on multi-MB market-data files. Older pandas or a missing
+        pyarrow install falls back to the default engine.
+
+        Args:
+            path (string): path of the csv file to be loaded.
+            dtype (dict, optional): per-column dtypes; skips inference. Defaults to None.
+            usecols (list, optional): column subset to parse. Defaults to None (all columns).
+            parse_dates (list, optional): columns to parse as dates. Defaults to None.
+
+        Returns:
+            pd.DataFrame: loaded data.
+        """
+        kwargs = {"dtype": dtype, "usecols": usecols,
+                  "parse_dates": parse_dates}
+        kwargs = {key: value for key,
+                  value in kwargs.items() if value is not None}
+        try:
+            return pd.read_csv(path, engine="pyarrow", **kwargs)
+        except (ImportError, ValueError, TypeError):
+            return pd.read_csv(path, **kwargs)
+
+    @staticmethod
+    def _load_json(path) -> pd.DataFrame:
+        """Loads and flattens a json file into a dataframe.
+
+        Parsing goes through orjson when it is installed: its C parser
+        decodes large json datasets several times faster than the stdlib
+        module. Without orjson the stdlib json module is used, so the
+        dependency stays optional.
+
+        Args:
+            path (string): path of the json file to be loaded.
+
+        Returns:
+            pd.DataFrame: loaded data.
+        """
+        if orjson is not None:
+            with open(path, "rb") as json_file:
+                return pd.json_normalize(orjson.loads(json_file.read()))
+        with open(path) as json_file:
+            json_data = json.load(json_file)
+            return pd.json_normalize(json_data)
+
+    @staticmethod
+    def load_from_file(path, columns=None, dtype=None, usecols=None, parse_dates=None, use_cache=False) -> pd.DataFrame:
         """Loads data from a given file path.
 
+        The loader is picked from the file extension with a single dict
+        lookup, so a suffix appearing elsewhere in the path (e.g. a
+        directory named data.csv.bak) can no longer select the wrong
+        parser.
+
+        Parquet and feather are the preferred formats for price history:
+        both store columns contiguously, load an order of magnitude
+        faster than csv/xlsx text parsing, and honor the columns argument
+        so unused OHLCV fields are never read off disk.
+
         Args:
             path (string): path of the file to be loaded.
+            columns (list, optional): column subset to read; only honored
+            by the columnar .parquet and .feather formats. Defaults to None (all columns).
+            dtype (dict, optional): per-column dtypes for the csv parser;
+            skips dtype inference and lets callers ask for float32 price
+            columns up front instead of downcasting after the fact. Defaults to None.
+            usecols (list, optional): column subset for the csv parser. Defaults to None (all columns).
+            parse_dates (list, optional): csv columns to parse as dates. Defaults to None.
+            use_cache (bool, optional): write a .parquet sidecar next to
+            text-based sources on first load and read it back on later
+            calls while the source is unmodified; repeat loads then skip
+            the text parse entirely. Ignored when dtype, usecols or
+            parse_dates are supplied, since the sidecar holds one fully
+            parsed frame and cannot honor differing parse options. Off
+            by default because it writes next to the source file. Defaults to False.
 
         Raises:
-            ValueError: Raised when the path contains a file type besides .csv , .xlsx and .json.
-            FileNotFound: Raised when the file to be loaded does not found. 
+            ValueError: Raised when the path contains a file type besides .csv , .xlsx, .json, .parquet and .feather.
+            FileNotFound: Raised when the file to be loaded does not found.
 
         Returns:
-            pd.DataFrame: loaded data. 
+            pd.DataFrame: loaded data.
         """
-        csv = ".csv"
-        excel = ".xlsx"
-        json_str = ".json"
-
+        loaders = {
+            ".csv": lambda p: DatasetCollector._load_csv(
+                p, dtype=dtype, usecols=usecols, parse_dates=parse_dates),
+            ".xlsx": lambda p: pd.read_excel(p, sheet_name=0),
+            ".json": DatasetCollector._load_json,
+            ".parquet": lambda p: pd.read_parquet(p, columns=columns),
+            ".feather": lambda p: pd.read_feather(p, columns=columns),
+        }
+        ext = os.path.splitext(path)[1].lower()
+        try:
+            loader = loaders[ext]
+        except KeyError:
+            raise ValueError(
+                f"Unexpected path input. Please try with .csv, .xlsx, .json, .parquet, .feather files"
+            )
         try:
-            if csv in path:
-                data = pd.read_csv(path)
-            elif excel in path:
-                data = pd.read_excel(path, sheet_name=0)
-            elif json_str in path:
-                with open(path) as json_file:
-                    json_data = json.load(json_file)
-                    data = pd.json_normalize(json_data)
-            else:
-                raise ValueError(
-                    f"Unexpected path input. Please try with .csv, .xlsx, .json files"
-                )
-            return data
+            # the sidecar stores one fully parsed frame, so it is only
+            # used when no parse options could make this load differ
+            # from the one that wrote it
+            if use_cache and ext in (".csv", ".xlsx", ".json") and \
+                    dtype is None and usecols is None and parse_dates is None:
+                sidecar = path + ".parquet"
+                # the sidecar is only trusted while it is at least as new
+                # as the source; editing the source invalidates it
+                if os.path.exists(sidecar) and \
+                        os.path.getmtime(sidecar) >= os.path.getmtime(path):
+                    # read the full frame: columns only applies to
+                    # columnar inputs, so pruning here would make cached
+                    # and uncached loads of a text source disagree
+                    return pd.read_parquet(sidecar)
+                data = loader(path)
+                try:
+                    data.to_parquet(sidecar)
+                except (ImportError, OSError, ValueError):
+                    # read-only location or no parquet engine; serve the
+                    # parsed frame and try again next load
+                    pass
+                return data
+            return loader(path)
         except FileNotFoundError:
             print("File not found.")
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 import os
 import yaml
@@ -7,8 +8,17 @@ def get_project_root() -> Path:
     return Path(__file__).parent
 
 
+@functools.lru_cache(maxsize=1)
 def read_config_file():
+    """Reads and caches user_params.yaml.
+
+    The file is opened and parsed at most once per process; every module
+    importing the config shares the same dict. Call
+    read_config_file.cache_clear() to force a re-read after editing the
+    file.
+    """
     root_dir = get_project_root()
     config_path = os.path.join(root_dir, 'user_params.yaml')
-    return yaml.safe_load(open(config_path))
+    with open(config_path) as config_file:
+        return yaml.safe_load(config_file)
 